@@ -13,20 +13,21 @@
 #    limitations under the License.
 
 import datetime
-import json
+import functools
 import logging
 import os
+import re
+import threading
+from concurrent.futures import Future
 from typing import NamedTuple, Union
 
 import dash
 import dash_bootstrap_components as dbc
-import dimod
 import numpy as np
+import orjson
 from dash import ALL, Input, Output, State, ctx, dcc, html
 from dash.exceptions import PreventUpdate
 from dwave.cloud import Client
-from dwave.embedding import embed_bqm, is_valid_embedding
-from dwave.system import DWaveSampler
 
 from demo_configs import (
     DEBUG,
@@ -68,6 +69,55 @@ except Exception:
     init_job_status = "NO SOLVER"
 
 
+def _index_helper_files(filenames):
+    """Index schedule and embedding files by the QPU-name prefix they support.
+
+    Args:
+        filenames: Filenames in the ``helpers`` directory.
+
+    Returns:
+        Two dicts, keyed by QPU name without its version suffix (e.g., ``Advantage_system4``):
+        the first maps to a list of schedule filenames, the second to an embeddings filename.
+    """
+    schedules = {}
+    embeddings = {}
+
+    for filename in sorted(filenames):
+        if filename.endswith("_fast_annealing_schedule.csv"):
+            qpu = filename.split("_", 1)[1].removesuffix("_fast_annealing_schedule.csv")
+            schedules.setdefault(re.sub(r"[._]\d+$", "", qpu), []).append(filename)
+
+        elif filename.startswith("emb_") and filename.endswith(".json"):
+            qpu = filename.removeprefix("emb_").removesuffix(".json")
+            embeddings[re.sub(r"[._]\d+$", "", qpu)] = filename
+
+    return schedules, embeddings
+
+
+# Scan the helpers directory once rather than on every QPU selection
+_SCHEDULE_INDEX, _EMBEDDING_INDEX = _index_helper_files(os.listdir("helpers"))
+
+# Job states while the user's inputs are disabled and once the job has ended
+RUNNING_STATES = frozenset({"EMBEDDING", "SUBMITTED", "PENDING", "IN_PROGRESS"})
+DONE_STATES = frozenset({"COMPLETED", "CANCELLED", "FAILED"})
+
+# Job-status watchdog backs off exponentially between these intervals, in ms
+WD_MIN_INTERVAL = 100
+WD_MAX_INTERVAL = 2000
+
+# Jobs not known to SAPI this long after submission are marked as failed
+SUBMIT_TIMEOUT = datetime.timedelta(minutes=2)
+
+# Cloud-client futures of jobs submitted by this process, keyed by job submission
+# time; only recent jobs are kept, as abandoned jobs are never polled to completion
+_computations = {}
+_computations_lock = threading.Lock()
+
+# Futures of the unembedded samples and kink statistics of recently completed jobs
+_job_results = {}
+_job_results_lock = threading.Lock()
+
+
 # Define the Navbar with two tabs
 navbar = dbc.Navbar(
     [
@@ -101,16 +151,20 @@ navbar = dbc.Navbar(
     sticky="top",
 )
 
+# Ring-length options with all lengths disabled (while a job runs) or enabled
+SPINS_OPTIONS = {
+    is_running: [{**option, "disabled": is_running} for option in config_spins.options]
+    for is_running in (True, False)
+}
 
-def tooltips(problem_type: Union[ProblemType, int]) -> list[dbc.Tooltip]:
-    """Tooltip generator.
+# Navbar tab classes with the tab of each problem type active, indexed by problem type
+NAV_CLASS_NAMES = [
+    ["active" if tab is problem_type else "" for tab in ProblemType] for problem_type in ProblemType
+]
 
-    Args:
-        problem_type: Either ProblemType.KZ or ProblemType.KZ_NM.
-    """
-    if not SHOW_TOOLTIPS:
-        return []
 
+def _build_tooltips(problem_type: ProblemType) -> list[dbc.Tooltip]:
+    """Build the tooltips of the settings form for a problem type."""
     tool_tips = tool_tips_kz if problem_type is ProblemType.KZ else tool_tips_kz_nm
 
     return [
@@ -124,6 +178,21 @@ def tooltips(problem_type: Union[ProblemType, int]) -> list[dbc.Tooltip]:
     ]
 
 
+_TOOLTIPS = {problem_type: _build_tooltips(problem_type) for problem_type in ProblemType}
+
+
+def tooltips(problem_type: Union[ProblemType, int]) -> list[dbc.Tooltip]:
+    """Tooltip generator.
+
+    Args:
+        problem_type: Either ProblemType.KZ or ProblemType.KZ_NM.
+    """
+    if not SHOW_TOOLTIPS:
+        return []
+
+    return _TOOLTIPS[ProblemType(problem_type)]
+
+
 app.layout = html.Div(
     [
         dcc.Store(id="coupling_data", data={}),  # KZ NM plot points
@@ -230,15 +299,12 @@ def update_selected_problem_type(
     if ctx.triggered_id and selected_problem == ctx.triggered_id["index"]:
         raise PreventUpdate
 
-    nav_class_names = [""] * len(problem_options)
     problem_type_value = ctx.triggered_id["index"] if ctx.triggered_id else ProblemType.KZ.value
     problem_type = ProblemType(problem_type_value)
     isKZ = problem_type is ProblemType.KZ
 
-    nav_class_names[problem_type_value] = "active"
-
     return (
-        nav_class_names,
+        NAV_CLASS_NAMES[problem_type_value],
         problem_type_value,
         "" if isKZ else "display-none",
         "display-none" if isKZ else "",
@@ -281,23 +347,17 @@ def alert_no_solver(dummy):
     Output("qpu_selection", "disabled"),
     inputs=[
         Input("job_submit_state", "children"),
-        State("spins", "options"),
     ],
     prevent_initial_call=True,
 )
-def disable_buttons(job_submit_state, spins_options):
+def disable_buttons(job_submit_state):
     """Disable user input during job submissions."""
-    running_states = ["EMBEDDING", "SUBMITTED", "PENDING", "IN_PROGRESS"]
-    done_states = ["COMPLETED", "CANCELLED", "FAILED"]
-    is_running = job_submit_state in running_states
+    is_running = job_submit_state in RUNNING_STATES
 
-    if job_submit_state not in running_states + done_states:
+    if not is_running and job_submit_state not in DONE_STATES:
         raise PreventUpdate
 
-    for inx, _ in enumerate(spins_options):
-        spins_options[inx]["disabled"] = is_running
-
-    return is_running, is_running, spins_options, is_running
+    return is_running, is_running, SPINS_OPTIONS[is_running], is_running
 
 
 @app.callback(
@@ -312,17 +372,112 @@ def set_schedule(qpu_name):
     schedule_filename_style = {"color": "#FFA143", "fontSize": 12}
 
     if qpu_name:
-        for filename in [file for file in os.listdir("helpers") if "schedule.csv" in file.lower()]:
+        # Accepts & reddens older versions
+        for filename in _SCHEDULE_INDEX.get(qpu_name.split(".")[0], []):
+            schedule_filename = filename
 
-            if qpu_name.split(".")[0] in filename:  # Accepts & reddens older versions
-                schedule_filename = filename
-
-                if qpu_name in filename:
-                    schedule_filename_style = {"color": "white", "fontSize": 12}
+            if qpu_name in filename:
+                schedule_filename_style = {"color": "white", "fontSize": 12}
 
     return schedule_filename, schedule_filename_style
 
 
+def _get_embedding(embeddings_cached, spins):
+    """Return the embedding for a ring length from the ``embeddings_cached`` store.
+
+    The store's JSON round trip turns integer keys into strings; only the requested
+    embedding is converted back.
+
+    Args:
+        embeddings_cached: Embeddings as held by the store, as
+            ``{"spins": {"node": [qubit]}}``.
+        spins: Number of spins in the ring.
+
+    Returns:
+        Embedding, as a dict of format ``{node: [qubit]}``.
+    """
+    return json_to_dict({spins: embeddings_cached[str(spins)]})[spins]
+
+
+def _get_job_results(job_id, spins, J, embeddings_cached):
+    """Return the unembedded samples and kink statistics of a completed job.
+
+    Several callbacks handle each job's completion, often in parallel requests, so
+    results are cached per job to retrieve and unembed the samples only once;
+    concurrent callers wait for the first caller's result.
+
+    Args:
+        job_id: Identification string of the job.
+        spins: Number of spins in the ring.
+        J: Coupling strength between the spins of the ring.
+        embeddings_cached: Embeddings as held by the ``embeddings_cached`` store.
+
+    Returns:
+        Unembedded dimod sample set, kinks per sample, and kink density.
+    """
+    key = (job_id, spins, J)
+
+    with _job_results_lock:
+        job_results = _job_results.get(key)
+        is_first_caller = job_results is None
+
+        if is_first_caller:
+            if len(_job_results) >= 8:  # Keep only recent jobs
+                del _job_results[next(iter(_job_results))]
+
+            job_results = _job_results[key] = Future()
+
+    if is_first_caller:
+        try:
+            embedding = _get_embedding(embeddings_cached, spins)
+            sampleset_unembedded = get_samples(client, job_id, spins, J, embedding)
+
+            job_results.set_result((sampleset_unembedded, *kink_stats(sampleset_unembedded, J)))
+        except Exception as exc:
+            with _job_results_lock:  # Let a later callback retry
+                if _job_results.get(key) is job_results:
+                    del _job_results[key]
+
+            job_results.set_exception(exc)
+
+    return job_results.result()
+
+
+@functools.lru_cache(maxsize=8)
+def _load_validated_embeddings(qpu_name):
+    """Load the stored embeddings for a QPU, keeping only those valid on its current graph.
+
+    Cached per QPU so switching back and forth between QPUs does not re-parse and
+    re-validate the embeddings file.
+
+    Args:
+        qpu_name: Name of the selected QPU.
+
+    Returns:
+        Embeddings in standard dict format, as ``{spins: {node: [qubit]}}``.
+    """
+    filename = _EMBEDDING_INDEX.get(qpu_name.split(".")[0])
+
+    if not filename:
+        return {}
+
+    import networkx as nx
+    from dwave.embedding import is_valid_embedding
+
+    with open(f"helpers/{filename}", "r") as fp:
+        embeddings = json_to_dict(orjson.loads(fp.read()))
+
+    # Validate that loaded embeddings' edges are still available on the selected QPU.
+    # Built once here, as is_valid_embedding otherwise converts an edge list per call.
+    target_graph = nx.Graph(qpus[qpu_name].edges)
+
+    for length in list(embeddings.keys()):
+        if not is_valid_embedding(embeddings[length], ring_edges(length), target_graph):
+            del embeddings[length]
+
+    return embeddings
+
+
 @app.callback(
     Output("embeddings_cached", "data"),
     Output("embedding_is_cached", "children"),
@@ -334,21 +489,7 @@ def load_cached_embeddings(qpu_name):
     embeddings_cached = {}  # Wipe out previous QPU's embeddings
 
     if qpu_name:
-        for filename in [file for file in os.listdir("helpers") if ".json" in file and "emb_" in file]:
-            if qpu_name.split(".")[0] in filename:
-                with open(f"helpers/{filename}", "r") as fp:
-                    embeddings_cached = json.load(fp)
-
-                embeddings_cached = json_to_dict(embeddings_cached)
-
-                # Validate that loaded embeddings' edges are still available on the selected QPU
-                for length in list(embeddings_cached.keys()):
-                    source_graph = dimod.to_networkx_graph(create_bqm(num_spins=length)).edges
-                    target_graph = qpus[qpu_name].edges
-                    emb = embeddings_cached[length]
-
-                    if not is_valid_embedding(emb, source_graph, target_graph):
-                        del embeddings_cached[length]
+        embeddings_cached = dict(_load_validated_embeddings(qpu_name))
 
     return embeddings_cached, ", ".join(str(embedding) for embedding in embeddings_cached.keys())
 
@@ -383,12 +524,10 @@ def add_graph_point_kz(
     kz_data,
 ):
     """Add new point to kink density graph when KZ job finishes."""
-    if job_submit_state != "COMPLETED" or problem_type is ProblemType.KZ_NM.value:
+    if job_submit_state != "COMPLETED" or problem_type == ProblemType.KZ_NM.value:
         raise PreventUpdate
 
-    embeddings_cached = json_to_dict(embeddings_cached)
-    sampleset_unembedded = get_samples(client, job_id, spins, J, embeddings_cached[spins])
-    _, kink_density = kink_stats(sampleset_unembedded, J)
+    _, _, kink_density = _get_job_results(job_id, spins, J, embeddings_cached)
 
     # Append the new data point
     kz_data.append((kink_density, ta))
@@ -439,12 +578,10 @@ def add_graph_point_kz_nm(
 ):
     """Add new point to Noise Ratio and Annealing Duration graphs when KZ Noise Mitigation job
     finishes."""
-    if job_submit_state != "COMPLETED" or problem_type is ProblemType.KZ.value:
+    if job_submit_state != "COMPLETED" or problem_type == ProblemType.KZ.value:
         raise PreventUpdate
 
-    embeddings_cached = json_to_dict(embeddings_cached)
-    sampleset_unembedded = get_samples(client, job_id, spins, J, embeddings_cached[spins])
-    _, kink_density = kink_stats(sampleset_unembedded, J)
+    _, _, kink_density = _get_job_results(job_id, spins, J, embeddings_cached)
 
     # Calculate lambda (previously kappa)
     # Added _ to avoid keyword restriction
@@ -453,13 +590,9 @@ def add_graph_point_kz_nm(
     fig_noise = plot_kink_density("coupling", figure_noise, kink_density, ta, J, lambda_)
     fig_anneal = plot_kink_density("kink_density", figure_anneal, kink_density, ta, J, lambda_)
 
-    # Initialize the list for this anneal_time if not present
+    # Append the new data point, initializing the list for this anneal_time if not present
     ta_str = str(ta)
-    if ta_str not in coupling_data:
-        coupling_data[ta_str] = []
-
-    # Append the new data point
-    coupling_data[ta_str].append(
+    coupling_data.setdefault(ta_str, []).append(
         {
             "lambda": lambda_,
             "kink_density": kink_density,
@@ -499,7 +632,7 @@ def load_new_graph_kz(
 ):
     """Initiates graphics for kink density based on theory and QPU samples on page load and when
     when settings change."""
-    if problem_type is ProblemType.KZ_NM.value:
+    if problem_type == ProblemType.KZ_NM.value:
         raise PreventUpdate
 
     if ctx.triggered_id in ["quench_schedule_filename", "spins", "coupling_strength"]:
@@ -528,7 +661,7 @@ def load_new_graph_kz(
 )
 def load_new_graphs_kz_nm(schedule_filename, spins, problem_type):
     """Initiates KZ Noise Mitigation graphs on page load and when settings change."""
-    if problem_type is ProblemType.KZ.value:
+    if problem_type == ProblemType.KZ.value:
         raise PreventUpdate
 
     time_range = [2, 1500]
@@ -562,16 +695,61 @@ def display_graphics_spin_ring(spins, job_submit_state, job_id, J, embeddings_ca
         if job_submit_state != "COMPLETED":
             raise PreventUpdate
 
-        embeddings_cached = json_to_dict(embeddings_cached)
-        sampleset_unembedded = get_samples(client, job_id, spins, J, embeddings_cached[spins])
-        kinks_per_sample, kink_density = kink_stats(sampleset_unembedded, J)
-        best_indx = np.abs(kinks_per_sample - kink_density).argmin()
+        sampleset_unembedded, kinks_per_sample, kink_density = _get_job_results(
+            job_id, spins, J, embeddings_cached
+        )
+        best_indx = int(np.argmin(np.abs(np.asarray(kinks_per_sample) - kink_density)))
         best_sample = sampleset_unembedded.record.sample[best_indx]
 
     fig = plot_spin_orientation(num_spins=spins, sample=best_sample)
     return fig
 
 
+@functools.lru_cache(maxsize=8)
+def _solver_adjacency(qpu_name):
+    """Adjacency of the QPU's working graph, built once from the already-loaded solver.
+
+    Args:
+        qpu_name: Name of the selected QPU.
+
+    Returns:
+        Adjacency as a dict of format ``{qubit: {neighbor_qubit, ...}}``.
+    """
+    solver = qpus[qpu_name]
+    adjacency = {qubit: set() for qubit in solver.nodes}
+
+    for u, v in solver.edges:
+        adjacency[u].add(v)
+        adjacency[v].add(u)
+
+    return adjacency
+
+
+def _submit_computation(qpu_name, bqm, embedding, **sample_params):
+    """Embed and submit a problem, returning once SAPI has assigned it an ID.
+
+    The cloud client uploads the problem on its own threads; only the wait for the
+    problem ID blocks the caller.
+
+    Args:
+        qpu_name: Name of the selected QPU.
+        bqm: Unembedded BQM of the ring.
+        embedding: Embedding of the ring on the QPU.
+        **sample_params: Parameters for the solver's ``sample_bqm`` method.
+
+    Returns:
+        dwave-cloud-client Future for the submitted problem.
+    """
+    from dwave.embedding import embed_bqm
+
+    bqm_embedded = embed_bqm(bqm, embedding, _solver_adjacency(qpu_name))
+
+    computation = qpus[qpu_name].sample_bqm(bqm=bqm_embedded, **sample_params)
+    computation.wait_id()
+
+    return computation
+
+
 class SubmitJobReturn(NamedTuple):
     """Return type for the ``submit_job`` callback function."""
 
@@ -606,16 +784,11 @@ def submit_job(
 ) -> SubmitJobReturn:
     """Submit job and provide job ID."""
 
-    solver = qpus[qpu_name]
-
     bqm = create_bqm(num_spins=spins, coupling_strength=J)
 
-    embeddings_cached = json_to_dict(embeddings_cached)
-    embedding = embeddings_cached[spins]
+    embedding = _get_embedding(embeddings_cached, spins)
     annealing_time = ta_ns / 1000
 
-    bqm_embedded = embed_bqm(bqm, embedding, DWaveSampler(solver=solver.name).adjacency)
-
     # ta_multiplier should be 1, unless (withNoiseMitigation and [J or schedule]) changes,
     # shouldn't change for MockSampler. In which case recalculate as
     # ta_multiplier=calclambda_(coupling_strength, schedule) as a function of the
@@ -623,11 +796,13 @@ def submit_job(
     # State("ta_multiplier", "value") ? Should recalculate when J or schedule changes IFF noise mitigation tab?
     ta_multiplier = 1
 
-    if problem_type is ProblemType.KZ_NM.value:
+    if problem_type == ProblemType.KZ_NM.value:
         ta_multiplier = calclambda_(J, schedule_name=filename)
 
-    computation = solver.sample_bqm(
-        bqm=bqm_embedded,
+    computation = _submit_computation(
+        qpu_name,
+        bqm,
+        embedding,
         fast_anneal=True,
         annealing_time=annealing_time * ta_multiplier,
         auto_scale=False,
@@ -636,7 +811,14 @@ def submit_job(
         label=f"Examples - Kibble-Zurek Simulation, submitted: {job_submit_time}",
     )
 
-    return SubmitJobReturn(job_id=computation.wait_id())
+    with _computations_lock:
+        if len(_computations) >= 16:  # Keep only recent jobs
+            del _computations[next(iter(_computations))]
+
+        _computations[job_submit_time] = computation
+
+    # The ID goes to the browser so any server process can poll the job's status
+    return SubmitJobReturn(job_id=computation.id)
 
 
 class RunButtonClickReturn(NamedTuple):
@@ -647,6 +829,7 @@ class RunButtonClickReturn(NamedTuple):
     wd_job_n_intervals: int = 0
     job_submit_state: str = dash.no_update
     job_submit_time: str = dash.no_update
+    wd_job_interval: int = WD_MIN_INTERVAL
 
 
 @app.callback(
@@ -655,6 +838,7 @@ class RunButtonClickReturn(NamedTuple):
     Output("wd_job", "n_intervals", allow_duplicate=True),
     Output("job_submit_state", "children"),
     Output("job_submit_time", "data"),
+    Output("wd_job", "interval", allow_duplicate=True),
     inputs=[
         Input("btn_simulate", "n_clicks"),
         State("embedding_is_cached", "children"),
@@ -671,7 +855,7 @@ def run_button_click(
     if str(spins) in cached_embeddings.split(", "):  # If we have a cached embedding
         return RunButtonClickReturn(
             job_submit_state="SUBMITTED",
-            job_submit_time=datetime.datetime.now().strftime("%c"),
+            job_submit_time=datetime.datetime.now().isoformat(),
         )
 
     return RunButtonClickReturn(job_submit_state="EMBEDDING")
@@ -707,6 +891,7 @@ class SimulateReturn(NamedTuple):
         State("spins", "value"),
         State("qpu_selection", "value"),
         State("embeddings_cached", "data"),
+        State("wd_job", "interval"),
     ],
     prevent_initial_call=True,
 )
@@ -718,6 +903,7 @@ def simulate(
     spins,
     qpu_name,
     embeddings_cached,
+    wd_job_interval,
 ) -> SimulateReturn:
     """Manage simulation: embedding, job submission."""
 
@@ -725,13 +911,12 @@ def simulate(
         try:
             embedding = find_one_to_one_embedding(spins, qpus[qpu_name].edges)
             if embedding:
-                embeddings_cached = json_to_dict(embeddings_cached)
-                embeddings_cached.update({spins: embedding})
+                embeddings_cached = {**embeddings_cached, str(spins): embedding}
 
                 return SimulateReturn(
-                    wd_job_interval=200,
+                    wd_job_interval=WD_MIN_INTERVAL,
                     job_submit_state="SUBMITTED",
-                    job_submit_time=datetime.datetime.now().strftime("%c"),
+                    job_submit_time=datetime.datetime.now().isoformat(),
                     embeddings_cached=embeddings_cached,
                     embedding_is_cached=", ".join(str(em) for em in embeddings_cached.keys()),
                 )
@@ -748,16 +933,28 @@ def simulate(
                 job_submit_state="FAILED",
             )
 
-    if job_submit_state in ["SUBMITTED", "PENDING", "IN_PROGRESS"]:
-        job_submit_state = get_job_status(client, job_id, job_submit_time)
-        wd_time = 1000
+    if job_submit_state in RUNNING_STATES:  # EMBEDDING is handled above
+        with _computations_lock:
+            computation = _computations.get(job_submit_time)
+
+        # A resolved future, held by the process that submitted the job, needs no
+        # further SAPI round trips
+        if computation is not None and computation.id == job_id and computation.done():
+            job_submit_state = computation_status(computation)
+        else:
+            job_submit_state = get_job_status(client, job_id, job_submit_time)
+
+            if not job_submit_state:  # Not (yet) known to SAPI
+                submitted = datetime.datetime.fromisoformat(job_submit_time)
+                timed_out = datetime.datetime.now() - submitted > SUBMIT_TIMEOUT
+                job_submit_state = "FAILED" if timed_out else "SUBMITTED"
 
-        if not job_submit_state:
-            job_submit_state = "SUBMITTED"
-            wd_time = 200
+        if job_submit_state in DONE_STATES:
+            with _computations_lock:
+                _computations.pop(job_submit_time, None)
 
         return SimulateReturn(
-            wd_job_interval=wd_time,
+            wd_job_interval=min(2 * wd_job_interval, WD_MAX_INTERVAL),
             wd_job_n_intervals=0,
             job_submit_state=job_submit_state,
         )
@@ -766,7 +963,7 @@ def simulate(
         btn_simulate_disabled=False,
         wd_job_disabled=True,
         job_submit_state=(
-            dash.no_update if job_submit_state in ["COMPLETED", "CANCELLED", "FAILED"] else "ERROR"
+            dash.no_update if job_submit_state in DONE_STATES else "ERROR"
         ),
     )
 
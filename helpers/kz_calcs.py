@@ -12,6 +12,8 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import functools
+
 from demo_configs import J_BASELINE
 import numpy as np
 import pandas as pd
@@ -25,6 +27,39 @@ __all__ = [
 ]
 
 
+@functools.lru_cache(maxsize=8)
+def _schedule_arrays(schedule_name):
+    """Energies of an anneal schedule and their derivatives.
+
+    Args:
+        schedule_name: Filename of anneal schedule.
+
+    Returns:
+        Read-only NumPy arrays ``A``, ``B``, ``A_tag``, ``B_tag``, with the
+        schedule energy compensation applied.
+    """
+    schedule = pd.read_csv(f"helpers/{schedule_name}")
+
+    COMPENSATION_SCHEDULE_ENERGY = 0.8 if "Advantage_system" in schedule_name else 1.0
+
+    A = COMPENSATION_SCHEDULE_ENERGY * schedule["A(s) (GHz)"].to_numpy()
+    B = COMPENSATION_SCHEDULE_ENERGY * schedule["B(s) (GHz)"].to_numpy()
+    s = schedule["s"].to_numpy()
+
+    # Derivatives of the energies for fast anneal (backward differences, as A_tag[i]
+    # pairs with A[i])
+    s_diff = np.diff(s, prepend=np.nan)
+    A_tag = np.diff(A, prepend=np.nan) / s_diff
+    B_tag = np.diff(B, prepend=np.nan) / s_diff
+
+    arrays = (A, B, A_tag, B_tag)
+    for array in arrays:
+        array.flags.writeable = False
+
+    return arrays
+
+
+@functools.lru_cache(maxsize=32)
 def theoretical_kink_density_prefactor(J, schedule_name=None):
     """Time rescaling factor.
 
@@ -32,6 +67,9 @@ def theoretical_kink_density_prefactor(J, schedule_name=None):
     the behaviour of a linearized schedule at coupling strength 1.
     See: "Error Mitigation in Quantum Annealing".
 
+    Depends only on the coupling strength and schedule, so is cached across
+    calls that sweep anneal times.
+
     Args:
         J: Coupling strength between the spins of the ring.
         schedule_name: Filename of anneal schedule. Used to compensate for
@@ -46,18 +84,9 @@ def theoretical_kink_density_prefactor(J, schedule_name=None):
     if not schedule_name:
         schedule_name = "FALLBACK_SCHEDULE.csv"
 
-    schedule = pd.read_csv(f"helpers/{schedule_name}")
-
-    COMPENSATION_SCHEDULE_ENERGY = 0.8 if "Advantage_system" in schedule_name else 1.0
-
-    A = COMPENSATION_SCHEDULE_ENERGY * schedule["A(s) (GHz)"]
-    B = COMPENSATION_SCHEDULE_ENERGY * schedule["B(s) (GHz)"]
-    s = schedule["s"]
+    A, B, A_tag, B_tag = _schedule_arrays(schedule_name)
 
-    A_tag = A.diff() / s.diff()  # Derivatives of the energies for fast anneal
-    B_tag = B.diff() / s.diff()
-
-    sc_indx = abs(A - B * abs(J)).idxmin()  # Anneal fraction, s, at the critical point
+    sc_indx = np.nanargmin(np.abs(A - B * abs(J)))  # Anneal fraction, s, at the critical point
 
     b_numerator = 1e9 * np.pi * A[sc_indx]  # D-Wave's schedules are in GHz
     b_denominator = B_tag[sc_indx] / B[sc_indx] - A_tag[sc_indx] / A[sc_indx]
@@ -82,7 +111,9 @@ def theoretical_kink_density(annealing_times_ns, J=None, schedule_name=None, b=N
     if b is None:
         b = theoretical_kink_density_prefactor(J, schedule_name)
 
-    return np.power([1e-9 * t * b for t in annealing_times_ns], -0.5) / (2 * np.pi * np.sqrt(2))
+    annealing_times_s = 1e-9 * np.asarray(annealing_times_ns, dtype=np.float64)
+
+    return (b * annealing_times_s) ** -0.5 / (2 * np.pi * np.sqrt(2))
 
 
 def calc_kappa(J):
@@ -106,6 +137,35 @@ def calclambda_(J, *, schedule_name=None):
     return b_ref / b
 
 
+def _count_sign_switches(samples_array):
+    """Count, per sample, the spins that differ in sign from their predecessor on the ring.
+
+    Spin signs are packed eight to a byte so the comparison and count run on an
+    eighth of the data.
+
+    Args:
+        samples_array: Samples of spin values, as a 2D NumPy array.
+
+    Returns:
+        Number of sign switches per sample, as a NumPy array.
+    """
+    num_spins = samples_array.shape[1]
+    packed = np.packbits(samples_array > 0, axis=1)
+
+    # Predecessor of each spin: shift rows right by one bit, carrying the low bit of
+    # each byte into the next and wrapping the ring's last spin around to the first
+    last_byte, last_bit = divmod(num_spins - 1, 8)
+    switches = packed >> 1
+    switches[:, 1:] |= packed[:, :-1] << 7
+    switches[:, 0] |= (packed[:, last_byte] >> (7 - last_bit)) << 7
+    switches ^= packed
+
+    # Clear the padding bits past the last spin
+    switches[:, -1] &= np.uint8(0xFF << (7 - last_bit) & 0xFF)
+
+    return np.bitwise_count(switches).sum(axis=1, dtype=np.int64)
+
+
 def kink_stats(sampleset, J):
     """Calculate kink density for the sample set.
 
@@ -122,17 +182,11 @@ def kink_stats(sampleset, J):
         all samples.
     """
     samples_array = sampleset.record.sample
-    sign_switches = np.diff(
-        samples_array, prepend=samples_array[:, -1].reshape(len(samples_array), 1)
-    )
-
-    if J < 0:
-        switches_per_sample = np.count_nonzero(sign_switches, 1)
-        kink_density = np.mean(switches_per_sample) / sampleset.record.sample.shape[1]
+    num_spins = samples_array.shape[1]
 
-        return switches_per_sample, kink_density
+    switches_per_sample = _count_sign_switches(samples_array)
 
-    non_switches_per_sample = np.count_nonzero(sign_switches == 0, 1)
-    kink_density = np.mean(non_switches_per_sample) / sampleset.record.sample.shape[1]
+    # Anti-ferromagnetic kinks are the pairs that do not switch sign
+    kinks_per_sample = switches_per_sample if J < 0 else num_spins - switches_per_sample
 
-    return non_switches_per_sample, kink_density
+    return kinks_per_sample, np.mean(kinks_per_sample) / num_spins
@@ -12,6 +12,8 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import functools
+
 from demo_configs import J_OPTIONS
 import numpy as np
 import pandas as pd
@@ -145,37 +147,12 @@ def plot_ze_estimates(fig, zne_estimates):
     return fig
 
 
-def plot_kink_densities_bg(
-    display,
-    time_range,
-    J_base,
-    schedule_name,
-    kz_data,
-):
-    """
-    Plot the background of theoretical kink density and QPU energy scales.
-
-    This function generates a Plotly figure that displays the theoretical
-    predictions for kink densities along with QPU energy scales based on
-    the provided anneal schedule. It supports different display modes
-    such as "both", "kink_density", and "schedule".
-
-    Args:
-        display (str): The type of plot to display. Options are:
-            - "both": Display both kink density and schedule.
-            - "kink_density": Display only the kink density plot.
-            - "schedule": Display only the anneal schedule.
-            - "coupling": Display coupling-related plots.
-        time_range (list of float): A list containing the minimum and maximum
-            quench times [min_quench_time, max_quench_time] in nanoseconds.
-        J_base (float): The base coupling strength between spins in the ring.
-        schedule_name (str): The filename of the anneal schedule CSV file.
-            If not provided, a fallback schedule is used.
+@functools.lru_cache(maxsize=64)
+def _plot_kink_densities_bg_static(display, time_range, J_base, schedule_name):
+    """Plot the parts of ``plot_kink_densities_bg`` that depend only on its settings.
 
-    Returns:
-        plotly.graph_objs.Figure: A Plotly figure object containing the
-        predicted kink densities and/or QPU energy scales based on the
-        specified display mode.
+    Cached per settings, so the returned figure is shared and must be copied
+    before it is modified. ``time_range`` must be a (hashable) tuple.
     """
     if not schedule_name:
         schedule_name = "FALLBACK_SCHEDULE.csv"
@@ -277,10 +254,58 @@ def plot_kink_densities_bg(
 
         fig_data.extend([energy_transverse, energy_problem])
 
+    fig = go.Figure(data=fig_data, layout=fig_layout)
+
+    fig.update_layout(legend=dict(x=0.1, y=0.1), margin=dict(b=5, l=5, r=20, t=10))
+
+    if display != "schedule":
+        add_conherent_thermalized_labels(fig, time_range, n)
+
+    return fig
+
+
+def plot_kink_densities_bg(
+    display,
+    time_range,
+    J_base,
+    schedule_name,
+    kz_data,
+):
+    """
+    Plot the background of theoretical kink density and QPU energy scales.
+
+    This function generates a Plotly figure that displays the theoretical
+    predictions for kink densities along with QPU energy scales based on
+    the provided anneal schedule. It supports different display modes
+    such as "both", "kink_density", and "schedule".
+
+    Args:
+        display (str): The type of plot to display. Options are:
+            - "both": Display both kink density and schedule.
+            - "kink_density": Display only the kink density plot.
+            - "schedule": Display only the anneal schedule.
+            - "coupling": Display coupling-related plots.
+        time_range (list of float): A list containing the minimum and maximum
+            quench times [min_quench_time, max_quench_time] in nanoseconds.
+        J_base (float): The base coupling strength between spins in the ring.
+        schedule_name (str): The filename of the anneal schedule CSV file.
+            If not provided, a fallback schedule is used.
+        kz_data (list of tuple): Previously computed (kink density, quench
+            duration) points from QPU samples.
+
+    Returns:
+        plotly.graph_objs.Figure: A Plotly figure object containing the
+        predicted kink densities and/or QPU energy scales based on the
+        specified display mode.
+    """
+    fig = go.Figure(
+        _plot_kink_densities_bg_static(display, tuple(time_range), J_base, schedule_name)
+    )
+
     if display != "schedule":
         # Add previously computed kz_data points
         for pair in kz_data:
-            fig_data.append(
+            fig.add_trace(
                 go.Scatter(
                     x=[pair[1]],
                     y=[pair[0]],
@@ -292,13 +317,6 @@ def plot_kink_densities_bg(
                 )
             )
 
-    fig = go.Figure(data=fig_data, layout=fig_layout)
-
-    fig.update_layout(legend=dict(x=0.1, y=0.1), margin=dict(b=5, l=5, r=20, t=10))
-
-    if display != "schedule":
-        add_conherent_thermalized_labels(fig, time_range, n)
-
     return fig
 
 
@@ -12,24 +12,39 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-import json
+import functools
+import threading
 
 import dimod
 import numpy as np
-from dwave.cloud.api import Problems, exceptions
-from dwave.embedding import unembed_sampleset
-from numpy.polynomial.polynomial import Polynomial
-from minorminer.subgraph import find_subgraph
+import orjson
 
 __all__ = [
+    "computation_status",
     "create_bqm",
     "find_one_to_one_embedding",
     "get_job_status",
     "get_samples",
     "json_to_dict",
     "fitted_function",
+    "ring_edges",
 ]
 
+# The server starts a thread per request, so polls share one SAPI client; its
+# requests session is not thread-safe, so calls through it are serialized
+_problems_api_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_problems_api(client):
+    """Return the SAPI ``Problems`` client for ``client``, reusing its session across polls.
+
+    Use only while holding ``_problems_api_lock``.
+    """
+    from dwave.cloud.api import Problems
+
+    return Problems.from_config(client.config)
+
 
 def create_bqm(num_spins=512, coupling_strength=-1.4):
     """
@@ -42,18 +57,54 @@ def create_bqm(num_spins=512, coupling_strength=-1.4):
     Returns:
         dimod BQM.
     """
-    bqm = dimod.BinaryQuadraticModel(vartype="SPIN")
+    spins = np.arange(num_spins)
+    couplings = (spins, (spins + 1) % num_spins, np.full(num_spins, coupling_strength))
+
+    return dimod.BinaryQuadraticModel.from_numpy_vectors(
+        linear=np.zeros(num_spins), quadratic=couplings, offset=0.0, vartype="SPIN"
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def ring_edges(num_spins):
+    """
+    Edges of the 1D ring of spins represented by ``create_bqm``.
+
+    Args:
+        num_spins: Number of spins in the ring.
+
+    Returns:
+        Frozenset of edges, as ``(spin, next_spin)`` tuples.
+    """
+    spins = np.arange(num_spins)
+
+    return frozenset(zip(spins.tolist(), np.roll(spins, -1).tolist()))
+
+
+@functools.lru_cache(maxsize=16)
+def _find_embedding(spins, edges_key, timeout):
+    """Find a one-to-one embedding of the ring on a QPU graph given as a frozenset of edges.
+
+    Raises ``ValueError`` if none is found; as ``lru_cache`` does not cache exceptions,
+    failed searches are retried on the next call.
+    """
+    from minorminer.subgraph import find_subgraph
+
+    emb_1to1 = find_subgraph(ring_edges(spins), edges_key, timeout=timeout)
 
-    for spin in range(num_spins):
-        bqm.add_quadratic(spin, (spin + 1) % num_spins, coupling_strength)
+    if not emb_1to1:
+        raise ValueError(f"No one-to-one embedding found for {spins} spins")
 
-    return bqm
+    return {k: (v,) for k, v in emb_1to1.items()}
 
 
 def find_one_to_one_embedding(spins, sampler_edgelist, timeout=60):
     """
     Find an embedding with chains of length one for the ring of spins.
 
+    Embeddings found are reused on later calls for the same ``spins`` and QPU
+    graph; failed searches are not cached so they can be retried.
+
     Args:
         spins: Number of spins.
         sampler_edgelist: Edges (couplers) of the QPU.
@@ -62,10 +113,34 @@ def find_one_to_one_embedding(spins, sampler_edgelist, timeout=60):
     Returns:
         Embedding, as a dict of format {spin: [qubit]}.
     """
-    ring_edges = {(i, (i+1) % spins) for i in range(spins)}
-    emb_1to1 = find_subgraph(ring_edges, sampler_edgelist, timeout=timeout)
+    try:
+        embedding = _find_embedding(spins, frozenset(map(tuple, sampler_edgelist)), timeout)
+    except ValueError:
+        return {}
 
-    return {k: (v,) for k, v in emb_1to1.items()}
+    return dict(embedding)
+
+
+def computation_status(computation):
+    """Return the final status of a resolved computation.
+
+    Args:
+        computation: dwave-cloud-client Future for which ``done()`` is True.
+
+    Returns:
+        Status string: ``"COMPLETED"``, ``"CANCELLED"`` or ``"FAILED"``.
+    """
+    from dwave.cloud.exceptions import CanceledFutureError
+
+    try:
+        exception = computation.exception()
+    except Exception as exc:  # Some cloud-client versions raise the stored exception
+        exception = exc
+
+    if exception is None:
+        return "COMPLETED"
+
+    return "CANCELLED" if isinstance(exception, CanceledFutureError) else "FAILED"
 
 
 def get_job_status(client, job_id, job_submit_time):
@@ -79,10 +154,15 @@ def get_job_status(client, job_id, job_submit_time):
     Returns:
         Embedding, as a dict of format ``{spin: [qubit]}``.
     """
-    p = Problems.from_config(client.config)
+    if not job_id:
+        return None
+
+    from dwave.cloud.api import exceptions
 
     try:
-        status = p.get_problem_status(job_id)
+        with _problems_api_lock:
+            status = _get_problems_api(client).get_problem_status(job_id)
+
         label_time = dict(status)["label"].split("submitted: ")[1]
 
         if label_time == job_submit_time:
@@ -108,11 +188,12 @@ def get_samples(client, job_id, num_spins, J, embedding):
     Returns:
         Unembedded dimod sample set.
     """
+    from dwave.embedding import unembed_sampleset
 
     bqm = create_bqm(num_spins=num_spins, coupling_strength=J)
 
-    if '"type": "SampleSet"' in job_id:  # See modifications to submit_job
-        sampleset = dimod.SampleSet.from_serializable(json.loads(job_id))
+    if job_id.startswith("{"):  # Serialized SampleSet; see modifications to submit_job
+        sampleset = dimod.SampleSet.from_serializable(orjson.loads(job_id))
     else:
         sampleset = client.retrieve_answer(job_id).sampleset
 
@@ -120,7 +201,7 @@ def get_samples(client, job_id, num_spins, J, embedding):
 
 
 def json_to_dict(emb_json):
-    """Retrieve an unembedded sampleset for a given job ID.
+    """Convert the string keys of JSON-formatted embeddings to integers.
 
     Args:
         emb_json: JSON-formatted dict of embeddings, as
@@ -131,10 +212,8 @@ def json_to_dict(emb_json):
 
     """
 
-    return {
-        int(key): {int(node): qubits for node, qubits in emb.items()}
-        for key, emb in emb_json.items()
-    }
+    # Qubit lists are already native; only the keys need converting
+    return {int(key): dict(zip(map(int, emb), emb.values())) for key, emb in emb_json.items()}
 
 
 def fitted_function(xdata, ydata):
@@ -146,12 +225,25 @@ def fitted_function(xdata, ydata):
         ydata: Array-like, dependent variable data points.
 
     Returns:
-        Callable function that takes a single argument `x` and returns the fitted value.
+        Callable function that takes a single argument `x` and returns the fitted
+        value, or None if the data cannot determine a fit.
     """
-    # y = a + b x**2
-    coeffs = Polynomial.fit(xdata**2, ydata, deg=1).convert().coef
+    # y = a + b x**2, by closed-form least squares on centered data
+    u = np.asarray(xdata, dtype=np.float64) ** 2
+    y = np.asarray(ydata, dtype=np.float64)
+
+    u_mean = u.mean()
+    u_centered = u - u_mean
+    ss_u = u_centered @ u_centered
+
+    if not ss_u > 0:
+        return None
+
+    b = (u_centered @ y) / ss_u
+    a = y.mean() - b * u_mean
 
     def y_func_x(x):
-        return np.polynomial.polynomial.polyval(x**2, coeffs)
+        x = np.asarray(x)
+        return a + b * (x * x)
 
     return y_func_x
@@ -0,0 +1,36 @@
+# Copyright 2025 D-Wave
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from contextvars import copy_context
+
+import pytest
+from dash._callback_context import context_value
+from dash._utils import AttributeDict
+
+
+@pytest.fixture
+def run_callback():
+    """Run a callback in its own context, as if triggered by the given input."""
+
+    def run(triggered_prop_id, callback, *args, **kwargs):
+        def run_in_context():
+            context_value.set(
+                AttributeDict(**{"triggered_inputs": [{"prop_id": triggered_prop_id}]})
+            )
+
+            return callback(*args, **kwargs)
+
+        return copy_context().run(run_in_context)
+
+    return run
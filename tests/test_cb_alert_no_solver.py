@@ -12,17 +12,13 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-from contextvars import copy_context
-
 import pytest
-from dash._callback_context import context_value
-from dash._utils import AttributeDict
 
 from app import alert_no_solver
 
 
 @pytest.mark.parametrize("input_val, output_val", [(0, True), (1, True), (0, False), (1, False)])
-def test_alert_no_solver(mocker, input_val, output_val):
+def test_alert_no_solver(mocker, run_callback, input_val, output_val):
     """Test that a failed cloud-client client is identified."""
 
     if output_val:
@@ -30,14 +26,5 @@ def test_alert_no_solver(mocker, input_val, output_val):
     else:
         mocker.patch("app.client", "dummy")
 
-    def run_callback():
-        context_value.set(
-            AttributeDict(**{"triggered_inputs": [{"prop_id": "btn_simulate.n_clicks"}]})
-        )
-
-        return alert_no_solver(input_val)
-
-    ctx = copy_context()
-
-    output = ctx.run(run_callback)
+    output = run_callback("btn_simulate.n_clicks", alert_no_solver, input_val)
     assert output == output_val
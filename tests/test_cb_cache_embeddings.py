@@ -12,14 +12,11 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-from contextvars import copy_context
 from io import StringIO
 
 import pytest
-from dash._callback_context import context_value
-from dash._utils import AttributeDict
 
-from app import load_cached_embeddings
+from app import _index_helper_files, _load_validated_embeddings, load_cached_embeddings
 
 embedding_filenames = [
     "emb_Advantage_system4.1.json",
@@ -63,28 +60,17 @@ parametrize_vals = [
     ],
     parametrize_vals,
 )
-def test_cache_embeddings_qpu_selection(mocker, qpu_name_val, embeddings, json_emb_file):
+def test_cache_embeddings_qpu_selection(
+    mocker, run_callback, qpu_name_val, embeddings, json_emb_file
+):
     """Test the caching of embeddings: triggered by QPU selection."""
 
-    mocker.patch("app.os.listdir", return_value=embeddings)
+    mocker.patch("app._EMBEDDING_INDEX", new=_index_helper_files(embeddings)[1])
     mocker.patch("builtins.open", return_value=StringIO(json_emb_file))
     mocker.patch("app.qpus", new=mock_qpu())
+    _load_validated_embeddings.cache_clear()
 
-    def run_callback():
-        context_value.set(
-            AttributeDict(
-                **{
-                    "triggered_inputs": [
-                        {"prop_id": "qpu_selection.value"},
-                    ]
-                }
-            )
-        )
-
-        return load_cached_embeddings(qpu_name_val)
-
-    ctx = copy_context()
-    output = ctx.run(run_callback)
+    output = run_callback("qpu_selection.value", load_cached_embeddings, qpu_name_val)
 
     if qpu_name_val == "Advantage_system4.1":
         assert output[1] == "5"
@@ -101,3 +87,19 @@ parametrize_vals = [
     ("needed", json_embeddings_file),
     ("not found", json_embeddings_file),
 ]
+
+
+def test_cache_embeddings_reselection(mocker):
+    """Test that reselecting a QPU reuses its loaded embeddings."""
+
+    mocker.patch("app._EMBEDDING_INDEX", new=_index_helper_files(embedding_filenames)[1])
+    mock_open = mocker.patch("builtins.open", return_value=StringIO(json_embeddings_file))
+    mocker.patch("app.qpus", new=mock_qpu())
+    _load_validated_embeddings.cache_clear()
+
+    first = load_cached_embeddings("Advantage2_prototype2.55")
+    second = load_cached_embeddings("Advantage2_prototype2.55")
+
+    assert first == second
+    assert first[0] is not second[0]
+    mock_open.assert_called_once()
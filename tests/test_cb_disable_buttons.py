@@ -12,43 +12,38 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-from contextvars import copy_context
-
 import pytest
-from dash._callback_context import context_value
-from dash._utils import AttributeDict
 from dash.exceptions import PreventUpdate
 
 from app import disable_buttons
-from helpers.layouts_components import ring_lengths
+from helpers.layouts_components import config_spins
 
 parametrize_names = [
     "job_submit_state_val",
-    "spins_val_in",
     "anneal_duration_val",
     "coupling_strength_val",
     "spins_val_out",
     "qpu_selection_val",
 ]
 
-spins_disabled = [{"disabled": True} for _ in ring_lengths]
-spins_enabled = [{"disabled": False} for _ in ring_lengths]
+spins_disabled = [{**option, "disabled": True} for option in config_spins.options]
+spins_enabled = [{**option, "disabled": False} for option in config_spins.options]
 parametrize_vals = [
-    ("EMBEDDING", spins_disabled, True, True, spins_disabled, True),
-    ("SUBMITTED", spins_disabled, True, True, spins_disabled, True),
-    ("PENDING", spins_disabled, True, True, spins_disabled, True),
-    ("IN_PROGRESS", spins_disabled, True, True, spins_disabled, True),
-    ("COMPLETED", spins_enabled, False, False, spins_enabled, False),
-    ("CANCELLED", spins_enabled, False, False, spins_enabled, False),
-    ("FAILED", spins_enabled, False, False, spins_enabled, False),
-    ("FAKE", spins_enabled, False, False, spins_enabled, False),
+    ("EMBEDDING", True, True, spins_disabled, True),
+    ("SUBMITTED", True, True, spins_disabled, True),
+    ("PENDING", True, True, spins_disabled, True),
+    ("IN_PROGRESS", True, True, spins_disabled, True),
+    ("COMPLETED", False, False, spins_enabled, False),
+    ("CANCELLED", False, False, spins_enabled, False),
+    ("FAILED", False, False, spins_enabled, False),
+    ("FAKE", False, False, spins_enabled, False),
 ]
 
 
 @pytest.mark.parametrize(parametrize_names, parametrize_vals)
 def test_disable_buttons(
+    run_callback,
     job_submit_state_val,
-    spins_val_in,
     anneal_duration_val,
     coupling_strength_val,
     spins_val_out,
@@ -56,25 +51,11 @@ def test_disable_buttons(
 ):
     """Test disabling buttons used during job submission."""
 
-    def run_callback():
-        context_value.set(
-            AttributeDict(
-                **{
-                    "triggered_inputs": [{"prop_id": "job_submit_state.children"}],
-                    "state_values": [{"prop_id": "spins.options"}],
-                }
-            )
-        )
-
-        return disable_buttons(job_submit_state_val, spins_val_in)
-
-    ctx = copy_context()
-
     if job_submit_state_val == "FAKE":
         with pytest.raises(PreventUpdate):
-            ctx.run(run_callback)
+            run_callback("job_submit_state.children", disable_buttons, job_submit_state_val)
     else:
-        output = ctx.run(run_callback)
+        output = run_callback("job_submit_state.children", disable_buttons, job_submit_state_val)
         assert output == (
             anneal_duration_val,
             coupling_strength_val,
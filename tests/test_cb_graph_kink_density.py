@@ -12,15 +12,11 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-from contextvars import copy_context
-
 from src.demo_enums import ProblemType
 import dimod
 import numpy as np
 import plotly
 import pytest
-from dash._callback_context import context_value
-from dash._utils import AttributeDict
 from dash.exceptions import PreventUpdate
 
 from app import add_graph_point_kz, add_graph_point_kz_nm, load_new_graph_kz, load_new_graphs_kz_nm
@@ -74,86 +70,66 @@ parametrize_vals = [
 @pytest.mark.parametrize(
     "trigger_val, kz_graph_display_val, job_submit_state_val, problem_type", parametrize_vals
 )
-def test_add_graph_point_kz(mocker, trigger_val, kz_graph_display_val, job_submit_state_val, problem_type):
+def test_add_graph_point_kz(
+    mocker, run_callback, trigger_val, kz_graph_display_val, job_submit_state_val, problem_type
+):
     """Test graph of kink density."""
 
     mocker.patch("app.get_samples", return_value=sampleset)
-
-    def run_callback():
-        context_value.set(
-            AttributeDict(
-                **{
-                    "triggered_inputs": [
-                        {"prop_id": trigger_val},
-                    ]
-                }
-            )
-        )
-
-        return add_graph_point_kz(
-            job_submit_state=job_submit_state_val,
-            graph_selection=kz_graph_display_val,
-            J=-1.4,
-            job_id="1234",
-            ta=10,
-            spins=5,
-            problem_type=problem_type,
-            embeddings_cached=json_embeddings_file,
-            figure=sample_vs_theory,
-            kz_data=[],
-        )
-
-    ctx = copy_context()
+    mocker.patch.dict("app._job_results", clear=True)
+
+    callback_kwargs = dict(
+        job_submit_state=job_submit_state_val,
+        graph_selection=kz_graph_display_val,
+        J=-1.4,
+        job_id="1234",
+        ta=10,
+        spins=5,
+        problem_type=problem_type,
+        embeddings_cached=json_embeddings_file,
+        figure=sample_vs_theory,
+        kz_data=[],
+    )
 
     if job_submit_state_val == "COMPLETED" and problem_type == ProblemType.KZ.value:
-        output = ctx.run(run_callback)
+        output = run_callback(trigger_val, add_graph_point_kz, **callback_kwargs)
 
         assert type(output[0]) == plotly.graph_objects.Figure
         assert output[1][0][1] == 10
     else:
         with pytest.raises(PreventUpdate):
-            ctx.run(run_callback)
+            run_callback(trigger_val, add_graph_point_kz, **callback_kwargs)
 
 
 @pytest.mark.parametrize(
     "trigger_val, kz_graph_display_val, job_submit_state_val, problem_type", parametrize_vals
 )
-def test_add_graph_point_kz_nm(mocker, trigger_val, kz_graph_display_val, job_submit_state_val, problem_type):
+def test_add_graph_point_kz_nm(
+    mocker, run_callback, trigger_val, kz_graph_display_val, job_submit_state_val, problem_type
+):
     """Test graph of kink density."""
 
     mocker.patch("app.get_samples", return_value=sampleset)
-
-    def run_callback():
-        context_value.set(
-            AttributeDict(
-                **{
-                    "triggered_inputs": [
-                        {"prop_id": trigger_val},
-                    ]
-                }
-            )
-        )
-
-        return add_graph_point_kz_nm(
-            job_submit_state=job_submit_state_val,
-            qpu_name=None,
-            J=-1.4,
-            schedule_filename="FALLBACK_SCHEDULE.csv",
-            job_id="1234",
-            ta=10,
-            spins=5,
-            problem_type=problem_type,
-            embeddings_cached=json_embeddings_file,
-            figure_noise=sample_vs_theory,
-            figure_anneal=sample_vs_theory,
-            coupling_data={},
-            zne_estimates={},
-        )
-
-    ctx = copy_context()
+    mocker.patch.dict("app._job_results", clear=True)
+
+    callback_kwargs = dict(
+        job_submit_state=job_submit_state_val,
+        qpu_name=None,
+        J=-1.4,
+        schedule_filename="FALLBACK_SCHEDULE.csv",
+        job_id="1234",
+        ta=10,
+        spins=5,
+        problem_type=problem_type,
+        embeddings_cached=json_embeddings_file,
+        figure_noise=sample_vs_theory,
+        figure_anneal=sample_vs_theory,
+        coupling_data={},
+        zne_estimates={},
+    )
 
     if job_submit_state_val == "COMPLETED" and problem_type == ProblemType.KZ_NM.value:
-        output = ctx.run(run_callback)
+        output = run_callback(trigger_val, add_graph_point_kz_nm, **callback_kwargs)
 
         assert type(output[0]) == plotly.graph_objects.Figure
         assert type(output[1]) == plotly.graph_objects.Figure
@@ -162,79 +138,59 @@ def test_add_graph_point_kz_nm(mocker, trigger_val, kz_graph_display_val, job_su
         assert output[4] == False
     else:
         with pytest.raises(PreventUpdate):
-            ctx.run(run_callback)
+            run_callback(trigger_val, add_graph_point_kz_nm, **callback_kwargs)
 
 
 @pytest.mark.parametrize(
     "trigger_val, kz_graph_display_val, job_submit_state_val, problem_type", parametrize_vals
 )
-def test_load_new_graph_kz(mocker, trigger_val, kz_graph_display_val, job_submit_state_val, problem_type):
+def test_load_new_graph_kz(
+    mocker, run_callback, trigger_val, kz_graph_display_val, job_submit_state_val, problem_type
+):
     """Test graph of kink density."""
 
     mocker.patch("app.get_samples", return_value=sampleset)
-
-    def run_callback():
-        context_value.set(
-            AttributeDict(
-                **{
-                    "triggered_inputs": [
-                        {"prop_id": trigger_val},
-                    ]
-                }
-            )
-        )
-
-        return load_new_graph_kz(
-            problem_type=problem_type,
-            graph_selection=kz_graph_display_val,
-            schedule_filename="FALLBACK_SCHEDULE.csv",
-            J=-1.4,
-            spins=5,
-            ta=10,
-            kz_data=[],
-        )
-
-    ctx = copy_context()
+    mocker.patch.dict("app._job_results", clear=True)
+
+    callback_kwargs = dict(
+        problem_type=problem_type,
+        graph_selection=kz_graph_display_val,
+        schedule_filename="FALLBACK_SCHEDULE.csv",
+        J=-1.4,
+        spins=5,
+        ta=10,
+        kz_data=[],
+    )
 
     if problem_type == ProblemType.KZ.value:
-        output = ctx.run(run_callback)
+        output = run_callback(trigger_val, load_new_graph_kz, **callback_kwargs)
 
         assert type(output[0]) == plotly.graph_objects.Figure
         assert output[1] == []
     else:
         with pytest.raises(PreventUpdate):
-            ctx.run(run_callback)
+            run_callback(trigger_val, load_new_graph_kz, **callback_kwargs)
 
 
 @pytest.mark.parametrize(
     "trigger_val, kz_graph_display_val, job_submit_state_val, problem_type", parametrize_vals
 )
-def test_load_new_graphs_kz_nm(mocker, trigger_val, kz_graph_display_val, job_submit_state_val, problem_type):
+def test_load_new_graphs_kz_nm(
+    mocker, run_callback, trigger_val, kz_graph_display_val, job_submit_state_val, problem_type
+):
     """Test graph of kink density."""
 
     mocker.patch("app.get_samples", return_value=sampleset)
+    mocker.patch.dict("app._job_results", clear=True)
 
-    def run_callback():
-        context_value.set(
-            AttributeDict(
-                **{
-                    "triggered_inputs": [
-                        {"prop_id": trigger_val},
-                    ]
-                }
-            )
-        )
-
-        return load_new_graphs_kz_nm(
-            schedule_filename="FALLBACK_SCHEDULE.csv",
-            spins=5,
-            problem_type=problem_type,
-        )
-
-    ctx = copy_context()
+    callback_kwargs = dict(
+        schedule_filename="FALLBACK_SCHEDULE.csv",
+        spins=5,
+        problem_type=problem_type,
+    )
 
     if problem_type == ProblemType.KZ_NM.value:
-        output = ctx.run(run_callback)
+        output = run_callback(trigger_val, load_new_graphs_kz_nm, **callback_kwargs)
 
         assert type(output[0]) == plotly.graph_objects.Figure
         assert type(output[1]) == plotly.graph_objects.Figure
@@ -242,4 +198,4 @@ def test_load_new_graphs_kz_nm(mocker, trigger_val, kz_graph_display_val, job_su
         assert output[3] == {}
     else:
         with pytest.raises(PreventUpdate):
-            ctx.run(run_callback)
+            run_callback(trigger_val, load_new_graphs_kz_nm, **callback_kwargs)
@@ -12,13 +12,12 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-from contextvars import copy_context
+import threading
+from concurrent.futures import Future
 
 import dimod
 import plotly
 import pytest
-from dash._callback_context import context_value
-from dash._utils import AttributeDict
 from dash.exceptions import PreventUpdate
 
 from app import display_graphics_spin_ring
@@ -44,56 +43,108 @@ parametrize_vals = [
 
 
 @pytest.mark.parametrize("spins_val, job_submit_state_val, embeddings_cached_val", parametrize_vals)
-def test_graph_spins_spin_trigger(spins_val, job_submit_state_val, embeddings_cached_val):
+def test_graph_spins_spin_trigger(
+    run_callback, spins_val, job_submit_state_val, embeddings_cached_val
+):
     """Test graph of spin ring: spins trigger."""
 
-    def run_callback():
-        context_value.set(
-            AttributeDict(
-                **{
-                    "triggered_inputs": [
-                        {"prop_id": "spins.value"},
-                    ]
-                }
-            )
+    callback_args = (spins_val, job_submit_state_val, "1234", 2.5, embeddings_cached_val)
+    output = run_callback("spins.value", display_graphics_spin_ring, *callback_args)
+    assert type(output) == plotly.graph_objects.Figure
+
+
+@pytest.mark.parametrize("spins_val, job_submit_state_val, embeddings_cached_val", parametrize_vals)
+def test_graph_spins_job_trigger(
+    mocker, run_callback, spins_val, job_submit_state_val, embeddings_cached_val
+):
+    """Test graph of spin ring: job-state trigger."""
+
+    mocker.patch("app.get_samples", return_value=sampleset)
+    mocker.patch.dict("app._job_results", clear=True)
+
+    callback_args = (spins_val, job_submit_state_val, "1234", 2.5, embeddings_cached_val)
+
+    if job_submit_state_val == "COMPLETED":
+        output = run_callback(
+            "job_submit_state.children", display_graphics_spin_ring, *callback_args
         )
+        assert type(output) == plotly.graph_objects.Figure
+    else:
+        with pytest.raises(PreventUpdate):
+            run_callback("job_submit_state.children", display_graphics_spin_ring, *callback_args)
+
 
-        return display_graphics_spin_ring(
-            spins_val, job_submit_state_val, "1234", 2.5, embeddings_cached_val
+def test_graph_spins_reuses_job_results(mocker, run_callback):
+    """Test graph of spin ring: samples of a completed job are retrieved once."""
+
+    get_samples = mocker.patch("app.get_samples", return_value=sampleset)
+    mocker.patch.dict("app._job_results", clear=True)
+
+    for _ in range(2):
+        run_callback(
+            "job_submit_state.children",
+            display_graphics_spin_ring, 5, "COMPLETED", "1234", 2.5, json_embeddings_file,
         )
 
-    ctx = copy_context()
+    get_samples.assert_called_once()
 
-    output = ctx.run(run_callback)
-    assert type(output) == plotly.graph_objects.Figure
 
+def test_graph_spins_shares_job_results_across_threads(mocker, run_callback):
+    """Test graph of spin ring: parallel callbacks retrieve a job's samples once."""
 
-@pytest.mark.parametrize("spins_val, job_submit_state_val, embeddings_cached_val", parametrize_vals)
-def test_graph_spins_job_trigger(mocker, spins_val, job_submit_state_val, embeddings_cached_val):
-    """Test graph of spin ring: job-state trigger."""
+    retrieving = threading.Event()
+    waiting = threading.Event()
+    future_result = Future.result
 
-    mocker.patch("app.get_samples", return_value=sampleset)
+    def result(future, *args, **kwargs):
+        waiting.set()
+        return future_result(future, *args, **kwargs)
+
+    def slow_get_samples(*args):
+        retrieving.set()
+        assert waiting.wait(5)  # Second callback waits on the in-flight result
+        return sampleset
+
+    mocker.patch.object(Future, "result", result)
+    get_samples = mocker.patch("app.get_samples", side_effect=slow_get_samples)
+    mocker.patch.dict("app._job_results", clear=True)
+
+    outputs = []
 
-    def run_callback():
-        context_value.set(
-            AttributeDict(
-                **{
-                    "triggered_inputs": [
-                        {"prop_id": "job_submit_state.children"},
-                    ]
-                }
+    def run_graph_callback():
+        outputs.append(
+            run_callback(
+                "job_submit_state.children",
+                display_graphics_spin_ring, 5, "COMPLETED", "1234", 2.5, json_embeddings_file,
             )
         )
 
-        return display_graphics_spin_ring(
-            spins_val, job_submit_state_val, "1234", 2.5, embeddings_cached_val
-        )
+    first = threading.Thread(target=run_graph_callback)
+    second = threading.Thread(target=run_graph_callback)
 
-    ctx = copy_context()
+    first.start()
+    assert retrieving.wait(5)
+    second.start()
 
-    if job_submit_state_val == "COMPLETED":
-        output = ctx.run(run_callback)
-        assert type(output) == plotly.graph_objects.Figure
-    else:
-        with pytest.raises(PreventUpdate):
-            ctx.run(run_callback)
+    first.join()
+    second.join()
+
+    get_samples.assert_called_once()
+    assert [type(output) for output in outputs] == [plotly.graph_objects.Figure] * 2
+
+
+def test_graph_spins_retries_failed_job_results(mocker, run_callback):
+    """Test graph of spin ring: a failed retrieval is not cached."""
+
+    get_samples = mocker.patch("app.get_samples", side_effect=[RuntimeError, sampleset])
+    mocker.patch.dict("app._job_results", clear=True)
+
+    args = (5, "COMPLETED", "1234", 2.5, json_embeddings_file)
+
+    with pytest.raises(RuntimeError):
+        run_callback("job_submit_state.children", display_graphics_spin_ring, *args)
+
+    output = run_callback("job_submit_state.children", display_graphics_spin_ring, *args)
+
+    assert type(output) == plotly.graph_objects.Figure
+    assert get_samples.call_count == 2
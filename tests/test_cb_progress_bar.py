@@ -12,11 +12,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-from contextvars import copy_context
-
 import pytest
-from dash._callback_context import context_value
-from dash._utils import AttributeDict
 
 from app import set_progress_bar
 from helpers.layouts_components import job_bar_display
@@ -31,20 +27,13 @@ parametrize_vals.extend([tuple(["BREAK FUNCTION", "exception", "exception"])])
 @pytest.mark.parametrize(
     "job_submit_state_val, bar_job_status_value, bar_job_status_color", parametrize_vals
 )
-def test_set_progress_bar(job_submit_state_val, bar_job_status_value, bar_job_status_color):
+def test_set_progress_bar(
+    run_callback, job_submit_state_val, bar_job_status_value, bar_job_status_color
+):
     """Test job-submission progress bar."""
 
-    def run_callback():
-        context_value.set(
-            AttributeDict(**{"triggered_inputs": [{"prop_id": "job_submit_state.children"}]})
-        )
-
-        return set_progress_bar(job_submit_state_val)
-
-    ctx = copy_context()
-
     try:
-        output = ctx.run(run_callback)
+        output = run_callback("job_submit_state.children", set_progress_bar, job_submit_state_val)
         assert output == (bar_job_status_value, bar_job_status_color)
     except KeyError:
         assert job_submit_state_val == "BREAK FUNCTION"
@@ -12,13 +12,9 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-from contextvars import copy_context
-
 import pytest
-from dash._callback_context import context_value
-from dash._utils import AttributeDict
 
-from app import set_schedule
+from app import _index_helper_files, set_schedule
 
 all_schedules = [
     "09-1263A-B_Advantage_system4.1_fast_annealing_schedule.csv",
@@ -36,19 +32,10 @@ parametrize_vals = [
 
 
 @pytest.mark.parametrize(["qpu_selection_val", "schedule_name", "indx", "style"], parametrize_vals)
-def test_schedule_selection(mocker, qpu_selection_val, schedule_name, indx, style):
+def test_schedule_selection(mocker, run_callback, qpu_selection_val, schedule_name, indx, style):
     """Test schedule selection."""
 
-    mocker.patch("app.os.listdir", return_value=schedule_name)
-
-    def run_callback():
-        context_value.set(
-            AttributeDict(**{"triggered_inputs": [{"prop_id": "qpu_selection.value"}]})
-        )
-
-        return set_schedule(qpu_selection_val)
-
-    ctx = copy_context()
+    mocker.patch("app._SCHEDULE_INDEX", new=_index_helper_files(schedule_name)[0])
 
-    output = ctx.run(run_callback)
+    output = run_callback("qpu_selection.value", set_schedule, qpu_selection_val)
     assert output == (schedule_name[indx], style)
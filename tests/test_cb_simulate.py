@@ -13,35 +13,29 @@
 #    limitations under the License.
 
 import datetime
-from contextvars import copy_context
 
 import pytest
 from dash import no_update
-from dash._callback_context import context_value
-from dash._utils import AttributeDict
+from dwave.cloud.exceptions import CanceledFutureError
 
-from app import SimulateReturn, run_button_click, simulate
+import app
+from app import SUBMIT_TIMEOUT, SimulateReturn, run_button_click, simulate
 
-before_test = datetime.datetime.now().strftime("%c")
+before_test = datetime.datetime.now().isoformat()
 parametrize_vals = [(512, "512, 1024", "SUBMITTED"), (2048, "512, 1024", "EMBEDDING")]
 
 
 @pytest.mark.parametrize(
     "spins_val, cached_embedding_lengths_val, submit_state_out", parametrize_vals
 )
-def test_simulate_button_press(spins_val, cached_embedding_lengths_val, submit_state_out):
+def test_simulate_button_press(
+    run_callback, spins_val, cached_embedding_lengths_val, submit_state_out
+):
     """Test pressing Simulate button initiates submission."""
 
-    def run_callback():
-        context_value.set(
-            AttributeDict(**{"triggered_inputs": [{"prop_id": "btn_simulate.n_clicks"}]})
-        )
-
-        return run_button_click(1, cached_embedding_lengths_val, spins_val)
-
-    ctx = copy_context()
-
-    output = ctx.run(run_callback)
+    output = run_callback(
+        "btn_simulate.n_clicks", run_button_click, 1, cached_embedding_lengths_val, spins_val
+    )
 
     assert output[0:4] == (True, False, 0, submit_state_out)
 
@@ -117,7 +111,7 @@ parametrize_vals = [
         {},
         no_update,
         no_update,
-        200,
+        1000,
         0,
         "SUBMITTED",
         no_update,
@@ -229,7 +223,7 @@ parametrize_vals = [
         {},
         no_update,
         no_update,
-        200,
+        100,
         no_update,
         "SUBMITTED",
         no_update,
@@ -256,6 +250,7 @@ parametrize_vals = [
 @pytest.mark.parametrize(parametrize_names, parametrize_vals)
 def test_simulate_states(
     mocker,
+    run_callback,
     job_id_val,
     job_submit_state_in,
     spins_val,
@@ -275,24 +270,18 @@ def test_simulate_states(
     mocker.patch("app.qpus", new=mock_qpu())
     mocker.patch("app.find_one_to_one_embedding", new=mock_find_embedding)
 
-    def run_callback():
-        context_value.set(
-            AttributeDict(**{"triggered_inputs": [{"prop_id": "wd_job.n_intervals"}]})
-        )
-
-        return simulate(
-            1,
-            job_id_val,
-            job_submit_state_in,
-            before_test,
-            spins_val,
-            "Advantage_system4.3",
-            embeddings_cached_in,
-        )
-
-    ctx = copy_context()
-
-    output = ctx.run(run_callback)
+    output = run_callback(
+        "wd_job.n_intervals",
+        simulate,
+        1,
+        job_id_val,
+        job_submit_state_in,
+        before_test,
+        spins_val,
+        "Advantage_system4.3",
+        embeddings_cached_in,
+        500,
+    )
 
     expected_output = SimulateReturn(
         btn_simulate_disabled=btn_simulate_disabled_out,
@@ -308,3 +297,68 @@ def test_simulate_states(
     assert output[0:5] == expected_output[0:5]
     assert output[6:] == expected_output[6:]
     # One could test ``job_submit_time_out >= before_test`` to little gain, much complication
+
+
+class mock_computation:
+    def __init__(self, done, exception=None):
+        self.id = "1234"
+        self._done = done
+        self._exception = exception
+
+    def done(self):
+        return self._done
+
+    def exception(self):
+        return self._exception
+
+
+parametrize_vals = [
+    ("1234", mock_computation(True), "COMPLETED", False),
+    ("1234", mock_computation(True, RuntimeError("Problem failed")), "FAILED", False),
+    ("1234", mock_computation(True, CanceledFutureError()), "CANCELLED", False),
+    ("1234", mock_computation(False), "IN_PROGRESS", True),
+    ("stale", mock_computation(True), "IN_PROGRESS", True),
+    ("1234", None, "IN_PROGRESS", True),
+]
+
+
+@pytest.mark.parametrize(
+    "job_id_val, computation_val, job_submit_state_out, sapi_polled", parametrize_vals
+)
+def test_simulate_computation(
+    mocker, run_callback, job_id_val, computation_val, job_submit_state_out, sapi_polled
+):
+    """Test a resolved computation completes the job without polling SAPI."""
+
+    get_status = mocker.patch("app.get_job_status", return_value="IN_PROGRESS")
+    mocker.patch.dict("app._computations", clear=True)
+
+    if computation_val:
+        app._computations[before_test] = computation_val
+
+    output = run_callback(
+        "wd_job.n_intervals", simulate, 1, job_id_val, "PENDING", before_test, 512,
+        "Advantage_system4.3", {}, 1500,
+    )
+
+    assert output.job_submit_state == job_submit_state_out
+    assert output.wd_job_interval == 2000
+    assert get_status.called == sapi_polled
+    # Finished jobs are dropped from the process's computations
+    assert (app._computations.get(before_test) is computation_val) == (
+        job_submit_state_out == "IN_PROGRESS"
+    )
+
+
+def test_simulate_submit_timeout(mocker, run_callback):
+    """Test a job never known to SAPI eventually fails."""
+
+    mocker.patch("app.get_job_status", return_value=None)
+    submitted = (datetime.datetime.now() - SUBMIT_TIMEOUT * 2).isoformat()
+
+    output = run_callback(
+        "wd_job.n_intervals", simulate, 1, None, "SUBMITTED", submitted, 512,
+        "Advantage_system4.3", {}, 1500,
+    )
+
+    assert output.job_submit_state == "FAILED"
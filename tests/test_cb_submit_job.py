@@ -12,12 +12,8 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-from contextvars import copy_context
-
-from dash._callback_context import context_value
-from dash._utils import AttributeDict
-
-from app import submit_job
+import app
+from app import _solver_adjacency, submit_job
 
 json_embeddings_file = {
     "3": {"1": [11], "0": [10], "2": [12]},
@@ -26,13 +22,21 @@ json_embeddings_file = {
 
 
 class mock_computation:
+    id = 1234
+
     def wait_id(self):
-        return 1234
+        return self.id
 
 
 class mock_solver:
     def __init__(self):
         self.name = "dummy"
+        self.nodes = {10, 11, 12, 13, 14}
+        self.edges = {
+            (10, 11), (10, 12), (10, 13), (10, 14),
+            (11, 12), (11, 13), (11, 14),
+            (12, 13), (12, 14),
+        }
 
     def sample_bqm(self, **kwargs):
         return mock_computation()
@@ -46,46 +50,28 @@ class mock_qpus:
         return self.solvers[indx]
 
 
-class dwave_sampler:
-    def __init__(self, solver):
-        self.adjacency = {
-            10: {11, 12, 13, 14},
-            11: {10, 12, 13, 14},
-            12: {10, 11, 13, 14},
-        }
-
-
 def test_job_submission(
     mocker,
+    run_callback,
 ):
     """Test job submission."""
 
     mocker.patch("app.qpus", new=mock_qpus())
-    mocker.patch("app.DWaveSampler", new=dwave_sampler)
-
-    def run_callback():
-        context_value.set(
-            AttributeDict(
-                **{
-                    "triggered_inputs": [
-                        {"prop_id": "job_submit_time.children"},
-                    ]
-                }
-            )
-        )
-
-        return submit_job(
-            job_submit_time="11:45AM",
-            qpu_name="Advantage_system88.4",
-            spins=3,
-            J=2.3,
-            ta_ns=7,
-            embeddings_cached=json_embeddings_file,
-            problem_type=0,
-            filename="FALLBACK_SCHEDULE.csv",
-        )
-
-    ctx = copy_context()
-    output = ctx.run(run_callback)
+    mocker.patch.dict("app._computations", clear=True)
+    _solver_adjacency.cache_clear()
+
+    output = run_callback(
+        "job_submit_time.children",
+        submit_job,
+        job_submit_time="11:45AM",
+        qpu_name="Advantage_system88.4",
+        spins=3,
+        J=2.3,
+        ta_ns=7,
+        embeddings_cached=json_embeddings_file,
+        problem_type=0,
+        filename="FALLBACK_SCHEDULE.csv",
+    )
 
     assert output == (1234, 0)
+    assert app._computations["11:45AM"].id == 1234
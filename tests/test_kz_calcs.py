@@ -15,6 +15,7 @@
 import os
 
 import dimod
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -74,3 +75,24 @@ def test_kz_stats():
 
     assert list(output[0]) == [3, 3, 3]
     assert output[1] == 0.6
+
+
+@pytest.mark.parametrize("num_spins", [1, 5, 8, 13, 512])
+def test_kz_stats_ring_lengths(num_spins):
+    """Test kink statistics against a direct count for ring lengths not aligned to bytes."""
+
+    rng = np.random.default_rng(num_spins)
+    samples = rng.choice([-1, 1], size=(20, num_spins))
+
+    sampleset = dimod.SampleSet.from_samples(samples, "SPIN", 0)
+
+    switches = np.count_nonzero(samples != np.roll(samples, 1, axis=1), axis=1)
+
+    output = kink_stats(sampleset, J=-1.0)
+
+    assert list(output[0]) == list(switches)
+    assert output[1] == pytest.approx(switches.mean() / num_spins)
+
+    output = kink_stats(sampleset, J=1.0)
+
+    assert list(output[0]) == list(num_spins - switches)
@@ -12,12 +12,16 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import json
+import threading
+
 import dimod
 import numpy as np
 import pandas as pd
 import pytest
 
 from helpers.qa import *
+from helpers.qa import _find_embedding, _problems_api_lock
 
 
 def test_create_bqm():
@@ -34,6 +38,13 @@ def test_create_bqm():
     assert output.quadratic == {(1, 0): 1.0}
 
 
+def test_ring_edges():
+    """Test ring edges."""
+
+    assert ring_edges(3) == {(0, 1), (1, 2), (2, 0)}
+    assert ring_edges(3) is ring_edges(3)
+
+
 def test_embedding():
     """Test embedder."""
 
@@ -46,6 +57,39 @@ def test_embedding():
     assert len(output) == 3
 
 
+def test_embedding_reuses_search(mocker):
+    """Test that embeddings found for a QPU graph are reused."""
+
+    _find_embedding.cache_clear()
+    mock_find = mocker.patch("minorminer.subgraph.find_subgraph", side_effect=[{}, {0: 10, 1: 11}])
+
+    edges = [(10, 11), (11, 12)]
+
+    assert find_one_to_one_embedding(spins=2, sampler_edgelist=edges) == {}
+
+    output = find_one_to_one_embedding(spins=2, sampler_edgelist=edges)
+    assert output == {0: (10,), 1: (11,)}
+
+    output = find_one_to_one_embedding(spins=2, sampler_edgelist=list(reversed(edges)))
+    assert output == {0: (10,), 1: (11,)}
+    assert mock_find.call_count == 2
+    assert _find_embedding.cache_info().currsize == 1
+
+
+def test_get_samples_serialized(mocker):
+    """Test retrieving samples from a serialized sample set."""
+
+    client = mocker.Mock()
+    sampleset = dimod.SampleSet.from_samples([[1, -1, 1]], "SPIN", 0)
+    embedding = {0: (10,), 1: (11,), 2: (12,)}
+    embedded = dimod.SampleSet.from_samples([{10: 1, 11: -1, 12: 1}], "SPIN", 0)
+
+    output = get_samples(client, json.dumps(embedded.to_serializable()), 3, -1.0, embedding)
+
+    assert (output.record.sample == sampleset.record.sample).all()
+    client.retrieve_answer.assert_not_called()
+
+
 def test_format_converter():
     """Test embedder."""
 
@@ -66,3 +110,40 @@ def test_fitted_function():
     output = fitted_function(xdata, ydata)
 
     assert output(1) == pytest.approx(2)
+
+
+def test_fitted_function_degenerate():
+    """Test fitted_function returns None when x**2 does not vary."""
+
+    output = fitted_function(np.array([-1, 1]), np.array([1, 2]))
+
+    assert output is None
+
+
+def test_job_status_reuses_api_client(mocker):
+    """Test that polling job status reuses the SAPI client."""
+
+    class mock_status:
+        status = mocker.Mock(value="COMPLETED")
+
+        def __iter__(self):
+            return iter({"label": "Kibble-Zurek, submitted: 11:45AM"}.items())
+
+    mock_from_config = mocker.patch("dwave.cloud.api.Problems.from_config")
+    client = mocker.Mock()
+
+    def get_problem_status(job_id):
+        assert _problems_api_lock.locked()  # Shared session is used by one poll at a time
+        return mock_status()
+
+    mock_from_config.return_value.get_problem_status.side_effect = get_problem_status
+
+    assert get_job_status(client, "1234", "11:45AM") == "COMPLETED"
+
+    # The server handles each watchdog tick on a new thread
+    poll = threading.Thread(target=get_job_status, args=(client, "1234", "10:00AM"))
+    poll.start()
+    poll.join()
+
+    mock_from_config.assert_called_once_with(client.config)
+    assert mock_from_config.return_value.get_problem_status.call_count == 2